@@ -9,63 +9,290 @@ Referência: Wolfram, S. (2002). A New Kind of Science.
 """
 
 import numpy as np
+import matplotlib
+matplotlib.use("Agg")          # backend sem janela, seguro em subprocessos
 import matplotlib.pyplot as plt
 import matplotlib.gridspec as gridspec
 from matplotlib.colors import ListedColormap
-from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+import functools
 import os
 
+try:
+    import numba as nb
+    _TEM_NUMBA = True
+except ImportError:        # numba é opcional; sem ele usa-se o caminho SWAR
+    _TEM_NUMBA = False
+
+try:
+    import _ca             # extensão Cython/OpenMP (python setup.py build_ext)
+    _TEM_CA = True
+except ImportError:        # opcional; sem ela usa-se o lote NumPy puro
+    _TEM_CA = False
+
 # ─────────────────────────────────────────────────────────────────
 # NÚCLEO DO AUTÔMATO
 # ─────────────────────────────────────────────────────────────────
 
-def aplicar_regra(celulas: np.ndarray, regra: int) -> np.ndarray:
+# Tabela de consulta global (256 × 8): _TABELA_REGRAS[r][indice] dá o
+# novo estado para o índice de vizinhança (0–7) da regra r. Construída
+# por broadcasting uma única vez no import; _TABELA_REGRAS[lista] extrai
+# as tabelas de um lote de regras em um único gather.
+_TABELA_REGRAS = ((np.arange(256)[:, None] >> np.arange(8)[None, :]) & 1
+                  ).astype(np.int8)
+
+
+def aplicar_regra(celulas: np.ndarray, regra: int,
+                  out: np.ndarray = None) -> np.ndarray:
     """
     Aplica uma regra de Wolfram (0-255) a uma linha de células.
 
+    Versão vetorizada: a linha é copiada para um buffer com uma célula
+    de enrolamento em cada ponta, de modo que os três vizinhos são
+    meras fatias (views) — sem os dois np.roll, que alocariam e
+    copiariam a linha inteira duas vezes. O índice de vizinhança (0–7)
+    é montado por deslocamento de bits e o novo estado sai de uma
+    tabela pré-computada, tudo em operações NumPy de nível C.
+
     Args:
         celulas: Array 1D de 0s e 1s representando o estado atual.
         regra:   Número da regra de Wolfram (0–255).
+        out:     Buffer int8 opcional para receber o resultado — evita
+                 alocar um array novo quando o chamador itera muitos
+                 passos (p.ex. escrevendo direto em historico[t]).
 
     Returns:
-        Novo array com o estado atualizado.
+        Array com o estado atualizado (o próprio `out`, se fornecido).
     """
     n = len(celulas)
-    nova = np.zeros(n, dtype=np.int8)
-    for i in range(n):
-        esq   = celulas[(i - 1) % n]  # vizinho esquerdo (bordas periódicas)
-        centro = celulas[i]
-        dir_  = celulas[(i + 1) % n]  # vizinho direito
-        indice = 4 * esq + 2 * centro + dir_
-        nova[i] = np.int8((regra >> int(indice)) & 1)
-    return nova
+    borda = np.empty(n + 2, dtype=celulas.dtype)
+    borda[0] = celulas[-1]       # enrolamento esquerdo (borda periódica)
+    borda[1:-1] = celulas
+    borda[-1] = celulas[0]       # enrolamento direito
+    esq, centro, dir_ = borda[:-2], borda[1:-1], borda[2:]
+    # Valores 0/1 deslocados em até 2 bits cabem em qualquer dtype
+    # inteiro — nenhuma conversão necessária.
+    indice = (esq << 2) | (centro << 1) | dir_
+    return np.take(_TABELA_REGRAS[regra], indice, out=out)
+
+
+def _forma_booleana(regra: int):
+    """
+    Converte uma regra (0–255) na sua forma booleana canônica (soma de
+    mintermos): devolve f(esq, centro, dir, out, rascunho) que usa
+    apenas AND/OR/NOT e, portanto, opera bit a bit sobre palavras
+    inteiras — 64 células por operação quando aplicada a arrays uint64.
+    Todas as operações escrevem em `out` e nos buffers de `rascunho`
+    (4 arrays uint64 do mesmo tamanho), sem alocar temporários.
+    """
+    mintermos = [k for k in range(8) if (regra >> k) & 1]
+
+    def f(esq, centro, dir_, out, rascunho):
+        n_esq, n_cen, n_dir, termo = rascunho
+        np.bitwise_not(esq, out=n_esq)
+        np.bitwise_not(centro, out=n_cen)
+        np.bitwise_not(dir_, out=n_dir)
+        out[:] = 0
+        for k in mintermos:
+            np.bitwise_and(esq if k & 4 else n_esq,
+                           centro if k & 2 else n_cen, out=termo)
+            np.bitwise_and(termo, dir_ if k & 1 else n_dir, out=termo)
+            np.bitwise_or(out, termo, out=out)
+        return out
+
+    return f
+
+
+def _empacotar_linha(linha: np.ndarray) -> np.ndarray:
+    """Empacota uma linha de 0s/1s em palavras uint64 (1 célula = 1 bit)."""
+    n = len(linha)
+    n_bytes = 8 * ((n + 63) // 64)          # múltiplo de 8 bytes
+    bytes_ = np.zeros(n_bytes, dtype=np.uint8)
+    bytes_[:(n + 7) // 8] = np.packbits(linha.astype(np.uint8),
+                                        bitorder="little")
+    return bytes_.view(np.uint64)
+
+
+def _desempacotar(palavras: np.ndarray, n_celulas: int) -> np.ndarray:
+    """Desempacota linhas de palavras uint64 de volta a uma grade int8."""
+    bits = np.unpackbits(palavras.view(np.uint8), axis=-1, bitorder="little")
+    return bits[..., :n_celulas].astype(np.int8)
+
+
+def _simular_bits(regra: int, linha_inicial: np.ndarray,
+                  n_passos: int) -> np.ndarray:
+    """
+    Evolui o autômato com células empacotadas em bits (SWAR): cada
+    palavra uint64 processa 64 células de uma vez com operações lógicas
+    puras, sem desvios. O histórico fica 8× menor em memória e só é
+    desempacotado para int8 no retorno.
+    """
+    n = len(linha_inicial)
+    f = _forma_booleana(regra)
+
+    palavras = _empacotar_linha(linha_inicial)
+    n_palavras = len(palavras)
+
+    # Máscara dos bits válidos (a última palavra pode ter bits de folga).
+    mascara = np.full(n_palavras, ~np.uint64(0))
+    resto = n % 64
+    if resto:
+        mascara[-1] = (np.uint64(1) << np.uint64(resto)) - np.uint64(1)
+
+    pos_ult = np.uint64((n - 1) % 64)       # posição do bit da célula n-1
+    um = np.uint64(1)
+    sessenta_e_tres = np.uint64(63)
+    historico = np.zeros((n_passos, n_palavras), dtype=np.uint64)
+    historico[0] = palavras
+
+    # Buffers de trabalho alocados uma única vez e reutilizados em todos
+    # os passos — nenhum array temporário é criado dentro do laço.
+    esq  = np.empty_like(palavras)
+    dir_ = np.empty_like(palavras)
+    rolagem = np.empty_like(palavras)
+    rascunho = tuple(np.empty_like(palavras) for _ in range(4))
+
+    for t in range(1, n_passos):
+        atual = historico[t - 1]
+        cel_0   = atual[0] & um                      # célula 0
+        cel_fim = (atual[-1] >> pos_ult) & um        # célula n-1
+
+        # Vizinhos: desloca dentro da palavra e emenda o bit que cruza
+        # a fronteira com a palavra adjacente (bordas periódicas).
+        np.left_shift(atual, um, out=esq)
+        rolagem[0] = atual[-1]
+        rolagem[1:] = atual[:-1]
+        np.right_shift(rolagem, sessenta_e_tres, out=rolagem)
+        np.bitwise_or(esq, rolagem, out=esq)
+
+        np.right_shift(atual, um, out=dir_)
+        rolagem[:-1] = atual[1:]
+        rolagem[-1] = atual[0]
+        np.left_shift(rolagem, sessenta_e_tres, out=rolagem)
+        np.bitwise_or(dir_, rolagem, out=dir_)
+
+        esq[0] = (esq[0] & ~um) | cel_fim
+        dir_[-1] = (dir_[-1] & ~(um << pos_ult)) | (cel_0 << pos_ult)
+
+        f(esq, atual, dir_, historico[t], rascunho)
+        np.bitwise_and(historico[t], mascara, out=historico[t])
+
+    return _desempacotar(historico, n)
+
+
+if _TEM_NUMBA:
+    @nb.njit(cache=True, boundscheck=False)
+    def _simular_nb(historico, lut):
+        """
+        Evolução completa compilada pelo Numba: toda a malha de tempo
+        roda dentro de uma única chamada JIT, sem despacho Python por
+        passo, e o laço linear de células é autovetorizado pelo LLVM.
+        """
+        n_passos, n = historico.shape
+        for t in range(1, n_passos):
+            ant = historico[t - 1]
+            prox = historico[t]
+            prox[0] = lut[(ant[n - 1] << 2) | (ant[0] << 1) | ant[1]]
+            for i in range(1, n - 1):
+                prox[i] = lut[(ant[i - 1] << 2) | (ant[i] << 1) | ant[i + 1]]
+            prox[n - 1] = lut[(ant[n - 2] << 2) | (ant[n - 1] << 1) | ant[0]]
+
+
+def _simular_lote(regras, n_celulas: int, n_passos: int) -> np.ndarray:
+    """
+    Evolui vários autômatos independentes em paralelo (lock-step), um
+    por regra, todos com a semente central. Cada passo avança todas as
+    grades com uma única expressão NumPy: o índice de vizinhança é
+    calculado em bloco e o novo estado sai de uma tabela por regra via
+    np.take_along_axis — amortizando o despacho Python sobre o lote.
+
+    Returns:
+        Array (len(regras) × n_passos × n_celulas) com os históricos.
+    """
+    regras = list(regras)
+    if _TEM_CA:
+        # Extensão compilada: um laço C por regra, regras distribuídas
+        # entre os núcleos via OpenMP com a GIL liberada.
+        return _ca.simular_lote(regras, n_celulas, n_passos)
+    luts = _TABELA_REGRAS[regras]                             # (k, 8)
+    estados = np.zeros((len(regras), n_celulas), dtype=np.int8)
+    estados[:, n_celulas // 2] = 1
+
+    historicos = np.zeros((len(regras), n_passos, n_celulas), dtype=np.int8)
+    historicos[:, 0] = estados
+    # Buffer persistente com uma coluna de enrolamento em cada lado:
+    # os vizinhos de todo o lote viram fatias, sem np.roll por passo.
+    borda = np.empty((len(regras), n_celulas + 2), dtype=np.int8)
+    for t in range(1, n_passos):
+        borda[:, 0] = estados[:, -1]
+        borda[:, 1:-1] = estados
+        borda[:, -1] = estados[:, 0]
+        indice = ((borda[:, :-2] << 2) | (borda[:, 1:-1] << 1) |
+                  borda[:, 2:])
+        estados = np.take_along_axis(luts, indice, axis=1)
+        historicos[:, t] = estados
+    return historicos
+
+
+def _evoluir(regra: int, linha_inicial: np.ndarray,
+             n_passos: int) -> np.ndarray:
+    """Evolui uma linha inicial por n_passos, no motor mais rápido disponível."""
+    if _TEM_NUMBA:
+        historico = np.zeros((n_passos, len(linha_inicial)), dtype=np.int8)
+        historico[0] = linha_inicial
+        _simular_nb(historico, _TABELA_REGRAS[regra])
+        return historico
+    return _simular_bits(regra, linha_inicial, n_passos)
+
+
+@functools.lru_cache(maxsize=None)
+def _simular_memo(regra: int, n_celulas: int, n_passos: int,
+                  semente: str) -> np.ndarray:
+    """Versão memoizada de simular() para sementes nomeadas (determinísticas)."""
+    linha_inicial = np.zeros(n_celulas, dtype=np.int8)
+    if semente == "centro":
+        linha_inicial[n_celulas // 2] = 1
+    else:
+        rng = np.random.default_rng(42)
+        linha_inicial = rng.integers(0, 2, size=n_celulas, dtype=np.int8)
+    return _evoluir(regra, linha_inicial, n_passos)
 
 
 def simular(regra: int, n_celulas: int = 256, n_passos: int = 128,
-            semente: str = "centro") -> np.ndarray:
+            semente: str = "centro", linha_inicial: np.ndarray = None,
+            layout: str = "linha") -> np.ndarray:
     """
     Simula um autômato celular 1D por n_passos iterações.
 
     Args:
-        regra:     Número da regra de Wolfram (0–255).
-        n_celulas: Número de células na grade.
-        n_passos:  Número de iterações (gerações).
-        semente:   "centro" (célula do meio = 1) ou "aleatoria".
+        regra:         Número da regra de Wolfram (0–255).
+        n_celulas:     Número de células na grade.
+        n_passos:      Número de iterações (gerações).
+        semente:       "centro" (célula do meio = 1) ou "aleatoria".
+        linha_inicial: Linha 0 explícita (array de 0s e 1s); quando
+                       fornecida, `semente` é ignorada.
+        layout:        "linha" (padrão): matriz (n_passos × n_celulas),
+                       gerações contíguas — ideal para varreduras por
+                       geração (densidade, imshow). "coluna": matriz
+                       transposta (n_celulas × n_passos) contígua no
+                       eixo do tempo — extrair a história de uma célula
+                       (p.ex. a coluna central como pseudo-RNG) vira uma
+                       fatia 1D contígua em vez de um passo de n bytes
+                       por leitura.
 
     Returns:
-        Matriz (n_passos × n_celulas) com o histórico de estados.
+        Matriz com o histórico de estados, no layout pedido.
     """
-    historico = np.zeros((n_passos, n_celulas), dtype=np.int8)
-
-    if semente == "centro":
-        historico[0, n_celulas // 2] = 1
+    if linha_inicial is not None:
+        linha_inicial = np.asarray(linha_inicial, dtype=np.int8)
+        historico = _evoluir(regra, linha_inicial, n_passos)
     else:
-        rng = np.random.default_rng(42)
-        historico[0] = rng.integers(0, 2, size=n_celulas, dtype=np.int8)
-
-    for t in range(1, n_passos):
-        historico[t] = aplicar_regra(historico[t - 1], regra)
+        # Sementes nomeadas são determinísticas → o resultado é memoizado
+        # e simulações repetidas (mesma regra e dimensões) saem do cache.
+        historico = _simular_memo(regra, n_celulas, n_passos, semente).copy()
 
+    if layout == "coluna":
+        return np.ascontiguousarray(historico.T)
     return historico
 
 
@@ -73,25 +300,23 @@ def simular(regra: int, n_celulas: int = 256, n_passos: int = 128,
 # ANÁLISE ESTATÍSTICA
 # ─────────────────────────────────────────────────────────────────
 
+def _codigos_3bits(historico: np.ndarray) -> np.ndarray:
+    """
+    Empacota cada vizinhança de 3 células em um código uint8 (0–7),
+    com bordas periódicas, para toda a grade de uma só vez.
+    """
+    h = historico.astype(np.uint8)
+    return ((np.roll(h, 1, axis=-1) << 2) | (h << 1) | np.roll(h, -1, axis=-1))
+
+
 def calcular_entropia(historico: np.ndarray) -> float:
     """
     Calcula a entropia de Shannon (bits) da distribuição de padrões
     de 3 células (8 possíveis) ao longo de toda a simulação.
     """
-    contagens: Counter = Counter()
-    for linha in historico:
-        for i in range(len(linha)):
-            padrao = (int(linha[(i - 1) % len(linha)]),
-                      int(linha[i]),
-                      int(linha[(i + 1) % len(linha)]))
-            contagens[padrao] += 1
-    total = sum(contagens.values())
-    entropia = 0.0
-    for cnt in contagens.values():
-        p = cnt / total
-        if p > 0:
-            entropia -= p * np.log2(p)
-    return entropia
+    contagens = np.bincount(_codigos_3bits(historico).ravel(), minlength=8)
+    p = contagens[contagens > 0] / contagens.sum()   # máscara evita log2(0)
+    return float(-(p * np.log2(p)).sum())
 
 
 def calcular_densidade(historico: np.ndarray) -> np.ndarray:
@@ -99,12 +324,65 @@ def calcular_densidade(historico: np.ndarray) -> np.ndarray:
     return historico.mean(axis=1)
 
 
-def autocorrelacao_espacial(linha: np.ndarray) -> np.ndarray:
-    """Calcula a autocorrelação normalizada de uma linha de células."""
+if hasattr(np, "bitwise_count"):        # NumPy ≥ 2.0
+    _popcount = np.bitwise_count
+else:                                   # tabela de 256 entradas como reserva
+    _TABELA_POPCOUNT = np.array([bin(b).count("1") for b in range(256)],
+                                dtype=np.uint8)
+
+    def _popcount(bytes_):
+        return _TABELA_POPCOUNT[bytes_]
+
+
+def simular_empacotado(regra: int, n_celulas: int = 256, n_passos: int = 128,
+                       semente: str = "centro") -> np.ndarray:
+    """
+    Como simular(), mas devolve o histórico com 8 células por byte
+    (np.packbits ao longo das colunas) — 8× menos memória para grades
+    grandes. Use np.unpackbits(h, axis=1)[:, :n_celulas] para plotar.
+    """
+    return np.packbits(simular(regra, n_celulas, n_passos, semente), axis=1)
+
+
+def calcular_densidade_empacotada(historico_emp: np.ndarray,
+                                  n_celulas: int) -> np.ndarray:
+    """
+    Fração de células vivas por geração, direto nos bytes empacotados:
+    conta os bits de cada byte (popcount) sem desempacotar a grade —
+    1/8 do tráfego de memória da varredura sobre int8.
+    """
+    return _popcount(historico_emp).sum(axis=1) / n_celulas
+
+
+def autocorrelacao_espacial(linha: np.ndarray,
+                            max_lag: int = None) -> np.ndarray:
+    """
+    Calcula a autocorrelação normalizada de uma linha de células.
+
+    Para linhas longas usa o teorema de Wiener–Khinchin: a autocorrelação
+    é a FFT inversa do espectro de potência, O(n log n) em vez do
+    np.correlate O(n²) no domínio do tempo. O preenchimento com zeros
+    até 2n evita o enrolamento circular, reproduzindo o resultado linear.
+
+    Args:
+        linha:   Array 1D com a linha de células.
+        max_lag: Se fornecido, calcula apenas os lags 0..max_lag por
+                 produto escalar direto — O(n·max_lag), mais barato que
+                 a FFT completa quando só poucos lags interessam.
+
+    Returns:
+        Autocorrelação (normalizada pelo lag 0) nos lags pedidos.
+    """
     linha_c = linha - linha.mean()
     n = len(linha_c)
-    resultado = np.correlate(linha_c, linha_c, mode='full')
-    resultado = resultado[n - 1:]  # metade positiva
+    if max_lag is not None and max_lag < n - 1:
+        resultado = np.array([linha_c[k:] @ linha_c[:n - k]
+                              for k in range(max_lag + 1)])
+    elif n < 64:  # abaixo disso o produto direto ainda ganha da FFT
+        resultado = np.correlate(linha_c, linha_c, mode='full')[n - 1:]
+    else:
+        espectro = np.fft.rfft(linha_c, 2 * n)
+        resultado = np.fft.irfft(espectro * espectro.conj(), 2 * n)[:n]
     if resultado[0] != 0:
         resultado = resultado / resultado[0]
     return resultado
@@ -118,9 +396,14 @@ CMAP_PRETO_BRANCO = ListedColormap(["white", "black"])
 
 
 def plotar_regra(regra: int, n_celulas: int = 256, n_passos: int = 200,
-                 semente: str = "centro", ax=None, titulo: str = None):
-    """Plota o espaço-tempo de uma regra."""
-    historico = simular(regra, n_celulas, n_passos, semente)
+                 semente: str = "centro", ax=None, titulo: str = None,
+                 historico: np.ndarray = None):
+    """
+    Plota o espaço-tempo de uma regra. Se `historico` for fornecido
+    (p.ex. vindo de uma simulação em lote), nada é re-simulado.
+    """
+    if historico is None:
+        historico = simular(regra, n_celulas, n_passos, semente)
     if ax is None:
         _, ax = plt.subplots(figsize=(8, 5))
     ax.imshow(historico, cmap=CMAP_PRETO_BRANCO, interpolation="nearest",
@@ -144,19 +427,24 @@ def figura_comparativa(regras=(30, 90, 110, 250), n_celulas=300,
                   110: "Regra 110 – Estrutura Localizada (Turing-completa)",
                   250: "Regra 250 – Repetição Periódica"}
 
-    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+    # layout="constrained" resolve o espaçamento numa única passada,
+    # dispensando tight_layout() + bbox_inches="tight" no savefig.
+    fig, axes = plt.subplots(2, 2, figsize=(14, 10), layout="constrained")
     fig.suptitle("Autômatos Celulares Elementares de Wolfram\n"
                  "Comparativo de Quatro Regras Canônicas",
-                 fontsize=15, fontweight="bold", y=1.01)
+                 fontsize=15, fontweight="bold")
+
+    # As quatro regras evoluem juntas, em lote, num único passo vetorial.
+    lote = _simular_lote(regras, n_celulas, n_passos)
 
     historicos = {}
-    for ax, regra in zip(axes.flat, regras):
+    for ax, regra, hist in zip(axes.flat, regras, lote):
         desc = descricoes.get(regra, f"Regra {regra}")
-        hist = plotar_regra(regra, n_celulas, n_passos, "centro", ax, desc)
+        plotar_regra(regra, n_celulas, n_passos, "centro", ax, desc,
+                     historico=hist)
         historicos[regra] = hist
 
-    plt.tight_layout()
-    plt.savefig(salvar_em, dpi=150, bbox_inches="tight")
+    plt.savefig(salvar_em, dpi=150)
     print(f"[✓] Figura comparativa salva em: {salvar_em}")
     plt.close()
     return historicos
@@ -170,12 +458,15 @@ def figura_analise_regra30(salvar_em="analise_regra30.png"):
     n_celulas, n_passos = 400, 300
     hist = simular(30, n_celulas, n_passos, semente="centro")
 
-    fig = plt.figure(figsize=(16, 12))
-    gs = gridspec.GridSpec(2, 3, figure=fig, hspace=0.45, wspace=0.35)
+    fig = plt.figure(figsize=(16, 12), layout="constrained")
+    gs = gridspec.GridSpec(2, 3, figure=fig)
 
     # ── 1. Espaço-tempo ──
     ax1 = fig.add_subplot(gs[0, :2])
-    ax1.imshow(hist, cmap=CMAP_PRETO_BRANCO, interpolation="nearest", aspect="auto")
+    # pcolorfast rasteriza sem o caminho de antialiasing do imshow;
+    # inverte-se o eixo y para manter o tempo crescendo para baixo.
+    ax1.pcolorfast(hist, cmap=CMAP_PRETO_BRANCO, vmin=0, vmax=1)
+    ax1.invert_yaxis()
     ax1.set_title("Diagrama Espaço-Tempo – Regra 30", fontsize=13, fontweight="bold")
     ax1.set_xlabel("Posição da célula")
     ax1.set_ylabel("Geração")
@@ -207,9 +498,9 @@ def figura_analise_regra30(salvar_em="analise_regra30.png"):
 
     # ── 4. Autocorrelação espacial (última geração) ──
     ax4 = fig.add_subplot(gs[1, 1])
-    acorr = autocorrelacao_espacial(hist[-1].astype(float))
-    lags = np.arange(min(80, len(acorr)))
-    ax4.plot(lags, acorr[:len(lags)], color="darkgreen", linewidth=1)
+    acorr = autocorrelacao_espacial(hist[-1].astype(float), max_lag=79)
+    lags = np.arange(len(acorr))
+    ax4.plot(lags, acorr, color="darkgreen", linewidth=1)
     ax4.axhline(0, color="gray", linestyle="--", linewidth=0.7)
     ax4.set_title("Autocorrelação Espacial\n(Geração Final)", fontsize=11, fontweight="bold")
     ax4.set_xlabel("Lag (células)")
@@ -217,18 +508,12 @@ def figura_analise_regra30(salvar_em="analise_regra30.png"):
 
     # ── 5. Distribuição de padrões de 3-bits ──
     ax5 = fig.add_subplot(gs[1, 2])
-    contagens: Counter = Counter()
-    for linha in hist:
-        for i in range(len(linha)):
-            p = (int(linha[(i-1) % len(linha)]),
-                 int(linha[i]),
-                 int(linha[(i+1) % len(linha)]))
-            contagens[p] += 1
-    labels = [f"{a}{b}{c}" for a, b, c in sorted(contagens)]
-    valores = [contagens[k] for k in sorted(contagens)]
-    cores = ["#e15759" if int("".join(map(str, k)), 2) in
-             [v for v in range(8) if (30 >> v) & 1] else "#4e79a7"
-             for k in sorted(contagens)]
+    contagens = np.bincount(_codigos_3bits(hist).ravel(), minlength=8)
+    presentes = np.flatnonzero(contagens)
+    labels = [f"{codigo:03b}" for codigo in presentes]
+    valores = contagens[presentes]
+    cores = ["#e15759" if (30 >> int(codigo)) & 1 else "#4e79a7"
+             for codigo in presentes]
     ax5.bar(labels, valores, color=cores)
     ax5.set_title("Frequência de Padrões de 3-bits\n(■ ativo = gera 1)", fontsize=11, fontweight="bold")
     ax5.set_xlabel("Padrão (esq-centro-dir)")
@@ -239,13 +524,15 @@ def figura_analise_regra30(salvar_em="analise_regra30.png"):
                          Patch(color="#4e79a7", label="→ saída 0")], fontsize=8)
 
     entropia = calcular_entropia(hist)
-    fig.text(0.5, -0.01,
-             f"Entropia de Shannon dos padrões de 3-bits: {entropia:.4f} bits  "
-             f"(máx teórico = 3.000 bits)",
-             ha="center", fontsize=10, style="italic",
-             bbox=dict(boxstyle="round", facecolor="#f0f0f0"))
-
-    plt.savefig(salvar_em, dpi=150, bbox_inches="tight")
+    # supxlabel entra na conta do layout "constrained" (fig.text abaixo
+    # da figura seria cortado sem o bbox_inches="tight").
+    fig.supxlabel(f"Entropia de Shannon dos padrões de 3-bits: "
+                  f"{entropia:.4f} bits  (máx teórico = 3.000 bits)",
+                  fontsize=10, style="italic",
+                  bbox=dict(boxstyle="round", facecolor="#f0f0f0"))
+
+    plt.savefig(salvar_em, dpi=150,
+                pil_kwargs={"optimize": True, "compress_level": 9})
     print(f"[✓] Análise da Regra 30 salva em: {salvar_em}")
     plt.close()
     return hist
@@ -263,19 +550,16 @@ def figura_comparacao_sementes(salvar_em="sensibilidade_condicoes_iniciais.png")
         ("50 células aleatórias = 1",     "aleatoria"),
     ]
 
-    fig, axes = plt.subplots(1, 3, figsize=(15, 6))
+    fig, axes = plt.subplots(1, 3, figsize=(15, 6), layout="constrained")
     fig.suptitle("Regra 30 – Sensibilidade às Condições Iniciais",
                  fontsize=13, fontweight="bold")
 
     for ax, (desc, tipo) in zip(axes, sementes_desc):
         if tipo == "duas":
-            hist = simular(30, n_celulas, n_passos, "centro")
-            # sobrescreve linha 0
-            hist[0] = 0
-            hist[0, n_celulas // 2]     = 1
-            hist[0, n_celulas // 2 + 1] = 1
-            for t in range(1, n_passos):
-                hist[t] = aplicar_regra(hist[t - 1], 30)
+            inicial = np.zeros(n_celulas, dtype=np.int8)
+            inicial[n_celulas // 2]     = 1
+            inicial[n_celulas // 2 + 1] = 1
+            hist = simular(30, n_celulas, n_passos, linha_inicial=inicial)
         else:
             hist = simular(30, n_celulas, n_passos, tipo)
 
@@ -286,8 +570,7 @@ def figura_comparacao_sementes(salvar_em="sensibilidade_condicoes_iniciais.png")
         ax.set_xticks([])
         ax.set_yticks([])
 
-    plt.tight_layout()
-    plt.savefig(salvar_em, dpi=150, bbox_inches="tight")
+    plt.savefig(salvar_em, dpi=150)
     print(f"[✓] Figura de sensibilidade salva em: {salvar_em}")
     plt.close()
 
@@ -297,18 +580,19 @@ def figura_espaco_regras(salvar_em="espaco_256_regras.png"):
     n_cel, n_pas = 101, 50
     regras_amostra = list(range(0, 256, 8))  # 32 regras
 
-    fig, axes = plt.subplots(4, 8, figsize=(18, 9))
+    fig, axes = plt.subplots(4, 8, figsize=(18, 9), layout="constrained")
     fig.suptitle("Espaço das 256 Regras de Wolfram (amostra, passo = 8)",
                  fontsize=13, fontweight="bold")
 
-    for ax, r in zip(axes.flat, regras_amostra):
-        hist = simular(r, n_cel, n_pas, "centro")
-        ax.imshow(hist, cmap=CMAP_PRETO_BRANCO, interpolation="nearest", aspect="auto")
+    historicos = _simular_lote(regras_amostra, n_cel, n_pas)
+    for ax, r, hist in zip(axes.flat, regras_amostra, historicos):
+        ax.pcolorfast(hist, cmap=CMAP_PRETO_BRANCO, vmin=0, vmax=1)
+        ax.invert_yaxis()
         ax.set_title(f"{r}", fontsize=7)
         ax.axis("off")
 
-    plt.tight_layout()
-    plt.savefig(salvar_em, dpi=120, bbox_inches="tight")
+    plt.savefig(salvar_em, dpi=100,
+                pil_kwargs={"optimize": True, "compress_level": 9})
     print(f"[✓] Espaço de regras salvo em: {salvar_em}")
     plt.close()
 
@@ -324,30 +608,34 @@ def main():
 
     os.makedirs("resultados", exist_ok=True)
 
-    print("\n[1/4] Gerando comparativo das quatro regras canônicas...")
-    historicos = figura_comparativa(
-        salvar_em="resultados/comparativo_regras.png")
-
-    print("\n[2/4] Gerando análise aprofundada da Regra 30...")
-    figura_analise_regra30(salvar_em="resultados/analise_regra30.png")
-
-    print("\n[3/4] Gerando análise de sensibilidade às condições iniciais...")
-    figura_comparacao_sementes(
-        salvar_em="resultados/sensibilidade_condicoes_iniciais.png")
-
-    print("\n[4/4] Gerando visão do espaço de 256 regras...")
-    figura_espaco_regras(salvar_em="resultados/espaco_256_regras.png")
-
-    # ── Métricas da Regra 30 ──
+    # As quatro figuras são independentes; cada uma roda em um processo
+    # próprio (matplotlib/Agg é seguro em subprocessos, hostil a threads).
+    print("\nGerando as quatro figuras em paralelo...")
+    with ProcessPoolExecutor(max_workers=4) as executor:
+        futuros = [
+            executor.submit(figura_comparativa,
+                            salvar_em="resultados/comparativo_regras.png"),
+            executor.submit(figura_analise_regra30,
+                            "resultados/analise_regra30.png"),
+            executor.submit(figura_comparacao_sementes,
+                            "resultados/sensibilidade_condicoes_iniciais.png"),
+            executor.submit(figura_espaco_regras,
+                            "resultados/espaco_256_regras.png"),
+        ]
+        hist30 = futuros[1].result()     # histórico 400×300 da Regra 30
+        for futuro in futuros:
+            futuro.result()              # propaga qualquer exceção
+
+    # ── Métricas da Regra 30 (grade 400×300 da análise aprofundada) ──
     print("\n── Métricas da Regra 30 ─────────────────────────────────")
-    hist30 = historicos[30]
     entropia = calcular_entropia(hist30)
     densidade_media = calcular_densidade(hist30).mean()
     coluna_central = hist30[:, hist30.shape[1] // 2]
     balance = coluna_central.mean()
-    # Comprimentos de runs (para randomicidade)
-    from itertools import groupby
-    runs = [sum(1 for _ in g) for _, g in groupby(coluna_central)]
+    # Comprimentos de runs (para randomicidade): as fronteiras entre runs
+    # são as posições onde o valor muda — RLE vetorizado via np.diff.
+    mudancas = np.flatnonzero(np.diff(coluna_central)) + 1
+    runs = np.diff(np.concatenate(([0], mudancas, [len(coluna_central)])))
     print(f"  Entropia de Shannon (padrões 3-bits): {entropia:.4f} bits")
     print(f"  Máximo teórico: 3.0000 bits")
     print(f"  Densidade média de células ativas:    {densidade_media:.4f}")
@@ -358,6 +646,8 @@ def main():
     print("-" * 60)
     print("Todos os resultados foram salvos em ./resultados/")
 
+    plt.close("all")  # libera qualquer figura remanescente
+
 
 if __name__ == "__main__":
     main()
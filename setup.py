@@ -0,0 +1,26 @@
+"""
+Compila a extensão opcional em Cython/OpenMP (_ca.pyx):
+
+    pip install cython
+    python setup.py build_ext --inplace
+
+Sem a extensão compilada, automato_celular.py funciona normalmente com o
+caminho NumPy puro.
+"""
+from setuptools import Extension, setup
+
+from Cython.Build import cythonize
+
+extensoes = [
+    Extension(
+        "_ca",
+        ["_ca.pyx"],
+        extra_compile_args=["-O3", "-fopenmp"],
+        extra_link_args=["-fopenmp"],
+    ),
+]
+
+setup(
+    name="automato-celular-wolfram",
+    ext_modules=cythonize(extensoes, language_level=3),
+)